@@ -22,19 +22,29 @@ import subprocess
 import sys
 import json
 import smtplib
+import importlib.util
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Optional, Dict
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
-try:
-    from openai import AzureOpenAI
-except ImportError:
+# openai is imported lazily in get_azure_client() - it dominates start-up time and
+# runs that never reach the LLM should not pay for it; only check it is installed
+if importlib.util.find_spec('openai') is None:
     print("ERROR: openai not installed. Run: pip install openai")
     sys.exit(1)
 
+# Try to use libgit2 bindings (optional) - commit metadata is read in-process
+# from the object database instead of spawning git
+try:
+    import pygit2
+    HAS_PYGIT2 = True
+except ImportError:
+    HAS_PYGIT2 = False
+
 
 # === CONFIGURATION ===
 SMTP_SERVER = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
@@ -63,6 +73,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def get_azure_client() -> "AzureOpenAI":
+    """Return a shared Azure OpenAI client (keeps its HTTP connection pool warm)."""
+    from openai import AzureOpenAI
+    
+    return AzureOpenAI(
+        api_key=AZURE_OPENAI_API_KEY,
+        api_version=AZURE_OPENAI_API_VERSION,
+        azure_endpoint=AZURE_OPENAI_ENDPOINT
+    )
+
+
 class FaultyCommitAnalyzer:
     """Orchestrates faulty commit detection and fix suggestion workflow."""
     
@@ -83,9 +105,16 @@ class FaultyCommitAnalyzer:
         self.faulty_commit_email = None
         self.faulty_commit_message = None
         self.faulty_commit_diff = None
+        self._repo = None  # pygit2.Repository, opened on first use
         
         logger.info(f"Analyzer initialized for {source_file}")
     
+    def _open_repo(self) -> "pygit2.Repository":
+        """Open the enclosing git repository with pygit2 (cached per analyzer)."""
+        if self._repo is None:
+            self._repo = pygit2.Repository(pygit2.discover_repository(os.getcwd()))
+        return self._repo
+    
     def find_last_good_commit(self) -> Optional[str]:
         """
         Find the most recent commit where the source file compiles successfully.
@@ -96,9 +125,10 @@ class FaultyCommitAnalyzer:
         logger.info("🔍 Searching for last good commit...")
         
         try:
-            # Get commit history
+            # Get commit history as full SHAs - the first one is HEAD, so no
+            # separate rev-parse is needed to know where to restore to
             result = subprocess.run(
-                ['git', 'log', '--oneline', '-20'],
+                ['git', 'log', '--format=%H', '-20'],
                 capture_output=True,
                 text=True,
                 timeout=10,
@@ -106,13 +136,7 @@ class FaultyCommitAnalyzer:
             )
             
             commits = result.stdout.strip().split('\n')
-            current_sha = subprocess.run(
-                ['git', 'rev-parse', 'HEAD'],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                check=True
-            ).stdout.strip()
+            current_sha = commits[0]
             
             for idx, commit_line in enumerate(commits):
                 try:
@@ -225,14 +249,6 @@ class FaultyCommitAnalyzer:
                     check=True
                 )
                 
-                # Get current bisect status
-                status_result = subprocess.run(
-                    ['git', 'log', '--oneline', '-1'],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                
                 # Try to determine if we've found the faulty commit
                 if 'first bad commit' in result.stdout or attempt >= MAX_BISECT_ATTEMPTS - 1:
                     faulty_sha = subprocess.run(
@@ -273,22 +289,13 @@ class FaultyCommitAnalyzer:
         logger.info(f"🔨 Verifying build without faulty commit {faulty_commit[:7]}...")
         
         try:
-            # Get current state
-            current_sha = subprocess.run(
-                ['git', 'rev-parse', 'HEAD'],
-                capture_output=True,
-                text=True,
-                check=True
-            ).stdout.strip()
-            
-            # Get parent of faulty commit
-            parent_result = subprocess.run(
-                ['git', 'rev-parse', f'{faulty_commit}^'],
+            # Get current state and parent of faulty commit in one rev-parse
+            current_sha, parent_sha = subprocess.run(
+                ['git', 'rev-parse', 'HEAD', f'{faulty_commit}^'],
                 capture_output=True,
                 text=True,
                 check=True
-            )
-            parent_sha = parent_result.stdout.strip()
+            ).stdout.split()
             
             # Stash current changes
             subprocess.run(['git', 'stash'], capture_output=True, check=False)
@@ -342,31 +349,23 @@ class FaultyCommitAnalyzer:
         logger.info(f"📧 Extracting author info from commit {commit_sha[:7]}...")
         
         try:
-            # Extract author and email
-            result = subprocess.run(
-                ['git', 'show', '-s', '--format=%an <%ae>', commit_sha],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            author_line = result.stdout.strip()
-            # Parse "Name <email>" format
-            if '<' in author_line and '>' in author_line:
-                self.faulty_commit_author = author_line.split('<')[0].strip()
-                self.faulty_commit_email = author_line.split('<')[1].split('>')[0].strip()
+            if HAS_PYGIT2:
+                commit = self._open_repo().revparse_single(commit_sha).peel(pygit2.Commit)
+                author, email, message = commit.author.name, commit.author.email, commit.message
             else:
-                self.faulty_commit_author = author_line
-                self.faulty_commit_email = None
+                # Author, email and commit message in one call, separated by \x1f
+                # (unit separator - can't appear in names, emails or normal messages)
+                result = subprocess.run(
+                    ['git', 'show', '-s', '--format=%an%x1f%ae%x1f%B', commit_sha],
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
+                author, email, message = result.stdout.split('\x1f', 2)
             
-            # Extract commit message
-            msg_result = subprocess.run(
-                ['git', 'show', '-s', '--format=%B', commit_sha],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            self.faulty_commit_message = msg_result.stdout.strip()
+            self.faulty_commit_author = author.strip()
+            self.faulty_commit_email = email.strip() or None
+            self.faulty_commit_message = message.strip()
             
             logger.info(f"  Author: {self.faulty_commit_author}")
             logger.info(f"  Email: {self.faulty_commit_email}")
@@ -424,11 +423,7 @@ class FaultyCommitAnalyzer:
             return None
         
         try:
-            client = AzureOpenAI(
-                api_key=AZURE_OPENAI_API_KEY,
-                api_version=AZURE_OPENAI_API_VERSION,
-                azure_endpoint=AZURE_OPENAI_ENDPOINT
-            )
+            client = get_azure_client()
             
             # Truncate diff and error if too large
             diff_truncated = self.faulty_commit_diff[:2000] if self.faulty_commit_diff else ""
@@ -613,8 +608,10 @@ Build Automation Pipeline"""
                 result['email'] = self.faulty_commit_email
                 result['message'] = self.faulty_commit_message
             
-            # Step 5: Extract commit diff
-            self.extract_commit_diff(faulty_commit)
+            # Step 5: Extract commit diff (only feeds the LLM prompt - skip the
+            # git show when no LLM is configured)
+            if AZURE_OPENAI_API_KEY and AZURE_OPENAI_ENDPOINT:
+                self.extract_commit_diff(faulty_commit)
             
             # Step 6: Generate fix suggestion
             fix_suggestion = self.generate_fix_suggestion_with_llm(compiler_error)
@@ -17,11 +17,24 @@ Setup:
 
 import os
 import json
+import re
 import sys
 from datetime import datetime
 from typing import Dict, Optional
 from learning_classifier import LearningDatabase
 
+# orjson is optional: C-accelerated parsing of the (often tens of KB) webhook body
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Compiled once - applied to every closed PR's title/body
+LOW_CONFIDENCE_COUNT_RE = re.compile(r'(\d+)\s+low-confidence', re.IGNORECASE)
+# Matches: **Issue N:** `category` (Confidence: X%)
+ISSUE_PATTERN_RE = re.compile(r'\*\*Issue\s+\d+:\*\*\s+`([^`]+)`\s+\(Confidence:\s+([\d.]+)%\)')
+
 
 class PROutcomeTracker:
     """Tracks PR outcomes (merged/closed) for learning feedback."""
@@ -161,8 +174,7 @@ class PROutcomeTracker:
     
     def _extract_low_confidence_count(self, pr_title: str) -> int:
         """Extract count of low-confidence issues from PR title."""
-        import re
-        match = re.search(r'(\d+)\s+low-confidence', pr_title, re.IGNORECASE)
+        match = LOW_CONFIDENCE_COUNT_RE.search(pr_title)
         return int(match.group(1)) if match else 0
     
     def _extract_error_patterns(self, pr_body: str) -> list:
@@ -175,14 +187,9 @@ class PROutcomeTracker:
         error message
         ```
         """
-        import re
-        
         patterns = []
         
-        # Match: **Issue N:** `category` (Confidence: X%)
-        issue_pattern = r'\*\*Issue\s+\d+:\*\*\s+`([^`]+)`\s+\(Confidence:\s+([\d.]+)%\)'
-        
-        for match in re.finditer(issue_pattern, pr_body):
+        for match in ISSUE_PATTERN_RE.finditer(pr_body):
             category_full = match.group(1)  # e.g., "low:business_logic"
             confidence = float(match.group(2)) / 100
             
@@ -215,7 +222,8 @@ def handle_webhook_request(request_body: str) -> Dict:
         Response dict with status and details
     """
     try:
-        payload = json.loads(request_body)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        payload = orjson.loads(request_body) if HAS_ORJSON else json.loads(request_body)
     except json.JSONDecodeError as e:
         return {"status": "error", "message": f"Invalid JSON: {e}"}
     
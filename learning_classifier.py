@@ -16,13 +16,22 @@ Learning Flow:
 4. Future errors use updated confidence scores
 """
 
+import heapq
 import json
+import mmap
 import os
 import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Tuple, List
 
+# orjson is optional: C-accelerated JSON, falls back to stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Configuration
 # Store in Git workspace (tracked files)
 WORKSPACE_DIR = os.getenv('WORKSPACE', os.getcwd())
@@ -33,7 +42,9 @@ os.makedirs(os.path.dirname(LEARNING_DB_PATH) if os.path.dirname(LEARNING_DB_PAT
 
 SUCCESS_THRESHOLD = 5  # Consecutive successes needed to promote
 FAILURE_THRESHOLD = 2  # Consecutive failures to demote back to LOW
-CONFIDENCE_BOOST_FACTOR = 0.05  # Each success adds 5% to base confidence (0.9 → 0.95)
+CONFIDENCE_BOOST_FACTOR = 0.05  # Success rate × this is added below HIGH (0.1 → at most 0.15)
+HIGH_CONFIDENCE_THRESHOLD = 0.9  # At or above this, errors are auto-fixed; nothing to boost
+MAX_ERROR_EXAMPLES = 5  # Most recent error examples kept per pattern
 
 
 class LearningDatabase:
@@ -42,36 +53,63 @@ class LearningDatabase:
     def __init__(self, db_path: str = LEARNING_DB_PATH):
         self.db_path = db_path
         self.data = self._load()
+        # Index of promoted pattern keys so lookups and stats only scan promoted patterns
+        self._promoted_keys = {
+            key for key, stats in self.data.get("patterns", {}).items()
+            if stats.get("promoted_to_high", False)
+        }
+    
+    @staticmethod
+    def _new_db() -> dict:
+        """Return an empty learning database."""
+        return {
+            "metadata": {
+                "version": "1.0",
+                "created": datetime.now().isoformat(),
+                "last_updated": datetime.now().isoformat(),
+                "total_fixes_attempted": 0,
+                "total_fixes_succeeded": 0,
+                "total_patterns_promoted": 0
+            },
+            "patterns": {},  # error_pattern_key -> learning stats
+            "pattern_history": []  # changelog of pattern updates
+        }
     
     def _load(self) -> dict:
         """Load learning database from JSON file."""
         if not os.path.exists(self.db_path):
-            return {
-                "metadata": {
-                    "version": "1.0",
-                    "created": datetime.now().isoformat(),
-                    "last_updated": datetime.now().isoformat(),
-                    "total_fixes_attempted": 0,
-                    "total_fixes_succeeded": 0,
-                    "total_patterns_promoted": 0
-                },
-                "patterns": {},  # error_pattern_key -> learning stats
-                "pattern_history": []  # changelog of pattern updates
-            }
+            return self._new_db()
         
         try:
-            with open(self.db_path, 'r') as f:
-                return json.load(f)
+            with open(self.db_path, 'rb') as f:
+                if HAS_ORJSON:
+                    # Parse straight from the mapped file, no intermediate bytes copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        data = orjson.loads(view)
+                else:
+                    data = json.loads(f.read())
         except Exception as e:
             print(f"⚠️ Failed to load learning DB: {e}, creating new one")
-            return self._load()  # Return fresh copy
+            return self._new_db()
+        
+        # DBs written by older versions may hold more examples than we keep
+        for stats in data.get("patterns", {}).values():
+            examples = stats.get("error_examples")
+            if examples and len(examples) > MAX_ERROR_EXAMPLES:
+                stats["error_examples"] = examples[-MAX_ERROR_EXAMPLES:]
+        
+        return data
     
     def save(self) -> bool:
         """Persist learning database to disk."""
         try:
             self.data["metadata"]["last_updated"] = datetime.now().isoformat()
-            with open(self.db_path, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            if HAS_ORJSON:
+                payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.data, indent=2).encode('utf-8')
+            with open(self.db_path, 'wb') as f:
+                f.write(payload)
             return True
         except Exception as e:
             print(f"⚠️ Failed to save learning DB: {e}")
@@ -90,6 +128,7 @@ class LearningDatabase:
             fix_attempt: What the AI tried to fix
         """
         pattern_key = f"{category}:{error_pattern}"
+        now = datetime.now().isoformat()
         
         if pattern_key not in self.data["patterns"]:
             self.data["patterns"][pattern_key] = {
@@ -105,7 +144,7 @@ class LearningDatabase:
                 "promotion_date": None,
                 "consecutive_successes": 0,
                 "consecutive_failures": 0,
-                "last_updated": datetime.now().isoformat(),
+                "last_updated": now,
                 "error_examples": [],
                 "fix_examples": []
             }
@@ -126,16 +165,18 @@ class LearningDatabase:
         
         # Update success rate
         stats["success_rate"] = stats["successful_fixes"] / stats["total_attempts"]
-        stats["last_updated"] = datetime.now().isoformat()
+        stats["last_updated"] = now
         
         # Store example for pattern refinement
         if error_message:
-            if len(stats["error_examples"]) < 5:  # Keep last 5 examples
-                stats["error_examples"].append({
-                    "error": error_message[:200],
-                    "timestamp": datetime.now().isoformat(),
-                    "success": success
-                })
+            examples = stats["error_examples"]
+            examples.append({
+                "error": error_message[:200],
+                "timestamp": now,
+                "success": success
+            })
+            if len(examples) > MAX_ERROR_EXAMPLES:  # Keep last N examples
+                del examples[:-MAX_ERROR_EXAMPLES]
     
     def check_promotion(self, error_pattern: str, category: str) -> Tuple[bool, str]:
         """
@@ -172,8 +213,10 @@ class LearningDatabase:
             return False
         
         stats = self.data["patterns"][pattern_key]
+        now = datetime.now().isoformat()
         stats["promoted_to_high"] = True
-        stats["promotion_date"] = datetime.now().isoformat()
+        stats["promotion_date"] = now
+        self._promoted_keys.add(pattern_key)
         
         self.data["pattern_history"].append({
             "action": "PROMOTED",
@@ -181,7 +224,7 @@ class LearningDatabase:
             "category": category,
             "success_rate": stats["success_rate"],
             "consecutive_successes": stats["consecutive_successes"],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         })
         
         self.data["metadata"]["total_patterns_promoted"] += 1
@@ -215,12 +258,9 @@ class LearningDatabase:
     
     def get_stats(self) -> dict:
         """Get learning database statistics."""
-        patterns = self.data["patterns"]
-        promoted = sum(1 for p in patterns.values() if p["promoted_to_high"])
-        
         return {
-            "total_patterns_tracked": len(patterns),
-            "patterns_promoted_to_high": promoted,
+            "total_patterns_tracked": len(self.data["patterns"]),
+            "patterns_promoted_to_high": len(self._promoted_keys),
             "total_fixes_attempted": self.data["metadata"]["total_fixes_attempted"],
             "total_fixes_succeeded": self.data["metadata"]["total_fixes_succeeded"],
             "overall_success_rate": (
@@ -249,11 +289,9 @@ class LearningDatabase:
         Returns:
             Confidence score (0.9 if promoted to HIGH, else None)
         """
-        # Look through patterns for any with this category that are HIGH confidence
-        for pattern_key, stats in self.data["patterns"].items():
-            if pattern_key.startswith(category):
-                if stats.get("promoted_to_high", False):
-                    return 0.9  # HIGH confidence
+        # Look through promoted patterns for any key starting with this category
+        if any(key.startswith(category) for key in self._promoted_keys):
+            return 0.9  # HIGH confidence
         
         return None  # Not promoted yet
 
@@ -271,8 +309,14 @@ class AdaptiveClassifier:
         """
         Classify error with confidence boosted by learning history.
         
+        Only confidences below HIGH_CONFIDENCE_THRESHOLD are boosted; anything
+        already at or above it is returned unchanged.
+        
         Returns: (category, adaptive_confidence)
         """
+        if base_confidence >= HIGH_CONFIDENCE_THRESHOLD:
+            return base_category, base_confidence  # Already HIGH - skip the lookup
+        
         adaptive_confidence = self.db.get_adaptive_confidence(
             error_message[:100],  # Use first 100 chars as pattern key
             base_category,
@@ -287,23 +331,23 @@ class AdaptiveClassifier:
         
         Should be called after PR is merged (success=True) or rejected (success=False)
         """
+        error_pattern = error_message[:100]
         self.db.record_fix_attempt(
-            error_pattern=error_message[:100],
+            error_pattern=error_pattern,
             category=category,
             success=success,
             error_message=error_message
         )
         
         # Check if pattern should be promoted
-        should_promote, reason = self.db.check_promotion(error_message[:100], category)
+        should_promote, reason = self.db.check_promotion(error_pattern, category)
         
         if should_promote:
-            self.db.promote_pattern(error_message[:100], category)
+            self.db.promote_pattern(error_pattern, category)  # Saves the DB itself
             print(f"  📈 {reason}")
         else:
             print(f"  📊 {reason}")
-        
-        self.db.save()
+            self.db.save()
 
 
 def integrate_learning_into_classifier(base_category: str, base_confidence: float) -> Tuple[str, float]:
@@ -338,11 +382,12 @@ def print_learning_stats():
     db_data = db.data["patterns"]
     if db_data:
         print("\n🏆 TOP PERFORMING PATTERNS:")
-        sorted_patterns = sorted(
+        # Top-5 selection instead of sorting every tracked pattern
+        sorted_patterns = heapq.nlargest(
+            5,
             db_data.items(),
-            key=lambda x: x[1]["success_rate"],
-            reverse=True
-        )[:5]
+            key=lambda x: x[1]["success_rate"]
+        )
         
         for pattern_key, stats in sorted_patterns:
             status = "✅" if stats["promoted_to_high"] else "⏳"
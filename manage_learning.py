@@ -14,7 +14,37 @@ Usage:
 import sys
 import json
 from learning_classifier import LearningDatabase, SUCCESS_THRESHOLD
-from tabulate import tabulate  # pip install tabulate
+
+
+def format_grid(rows, headers) -> str:
+    """
+    Render rows as a "grid" table (same layout as tabulate's tablefmt="grid").
+    
+    Numeric columns are right-aligned, everything else left-aligned.
+    """
+    cells = [[str(c) for c in row] for row in rows]
+    widths = [max([len(h)] + [len(row[i]) for row in cells]) for i, h in enumerate(headers)]
+    numeric = [
+        bool(rows) and all(isinstance(row[i], (int, float)) and not isinstance(row[i], bool) for row in rows)
+        for i in range(len(headers))
+    ]
+    
+    def line(fill):
+        return "+" + "+".join(fill * (w + 2) for w in widths) + "+"
+    
+    def fmt(values, align_numbers=True):
+        return "| " + " | ".join(
+            v.rjust(w) if align_numbers and num else v.ljust(w)
+            for v, w, num in zip(values, widths, numeric)
+        ) + " |"
+    
+    sep = line("-")
+    out = [sep, fmt(headers, align_numbers=False), line("=")]
+    for row in cells:
+        out.append(fmt(row))
+        out.append(sep)
+    return "\n".join(out)
+
 
 def cmd_stats():
     """Display overall learning statistics."""
@@ -34,7 +64,7 @@ def cmd_stats():
         ["Last Updated", stats["last_updated"]]
     ]
     
-    print(tabulate(data, headers=["Metric", "Value"], tablefmt="grid"))
+    print(format_grid(data, ["Metric", "Value"]))
     print()
 
 
@@ -66,7 +96,7 @@ def cmd_patterns():
         ])
     
     headers = ["Pattern", "Attempts", "Successes", "Failures", "Rate", "Progress", "Status"]
-    print(tabulate(data, headers=headers, tablefmt="grid"))
+    print(format_grid(data, headers))
     print()
 
 
@@ -96,7 +126,7 @@ def cmd_promoted():
         ])
     
     headers = ["Pattern", "Attempts", "Successes", "Success Rate", "Promoted Date"]
-    print(tabulate(data, headers=headers, tablefmt="grid"))
+    print(format_grid(data, headers))
     print()
     
     print(f"💡 TIP: Update HIGH_CONFIDENCE_PATTERNS in build_fix_v2.py with these patterns")
@@ -114,8 +144,8 @@ def cmd_pattern(pattern_name: str):
     if not matching:
         print(f"\n❌ Pattern '{pattern_name}' not found in database")
         print("\nAvailable patterns:")
-        for key in patterns.keys():
-            print(f"  - {key}")
+        # One write for the whole list instead of a print() per pattern
+        sys.stdout.write(''.join(f"  - {key}\n" for key in patterns))
         return
     
     for pattern_key, stats in matching.items():
@@ -137,7 +167,7 @@ def cmd_pattern(pattern_name: str):
             ["Last Updated", stats["last_updated"]]
         ]
         
-        print(tabulate(data, headers=["Attribute", "Value"], tablefmt="grid"))
+        print(format_grid(data, ["Attribute", "Value"]))
         
         # Show error examples
         if stats["error_examples"]:
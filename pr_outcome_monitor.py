@@ -3,14 +3,16 @@
 PR Outcome Monitor - Tracks PR merge status and updates learning database.
 
 Features:
-1. PERIODIC PR STATUS CHECKS: Monitors PRs created by auto-fix system
+1. RECONCILIATION PR STATUS CHECKS: pr_merge_handler's webhook endpoint records
+   outcomes as they happen; this job only polls PRs still open after
+   PR_RECONCILE_AFTER_HOURS, i.e. ones whose webhook delivery was missed
 2. SUCCESS/FAILURE TRACKING: Determines if PR was merged without modifications
 3. ROOT CAUSE LEARNING: Updates learning_db.json with outcomes
 4. AUTOMATIC PROMOTION: Upgrades patterns to HIGH confidence after success threshold
 5. DEMOTION ON FAILURE: Reduces confidence if pattern consistently fails
 
 Workflow:
-1. Read pr_tracking.json (list of open PRs with metadata)
+1. Read pr_tracking.json (list of open PRs with metadata older than the reconcile window)
 2. Check GitHub API for current PR status
 3. If merged without changes → mark as success
 4. If closed or modified → mark as failure
@@ -50,20 +52,45 @@ Learning Database Schema (learning_db.json):
 """
 
 import os
+import re
 import json
+import mmap
+import queue
+import atexit
 import logging
+import logging.handlers
+import tempfile
 import subprocess
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
 from typing import List, Dict, Optional, Tuple
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("ERROR: requests not installed. Run: pip install requests")
     import sys
     sys.exit(1)
 
+# orjson is optional: C-accelerated load/save of the tracking and learning files
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# fcntl is POSIX-only; without it learning_state_lock is a no-op (single-writer setups)
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
 
 # === CONFIGURATION ===
 GITHUB_PAT = os.getenv('GITHUB_PAT', '')
@@ -74,26 +101,114 @@ REPO_NAME = os.getenv('REPO_NAME', 'poc-auto-pr-fix')
 WORKSPACE_DIR = os.getenv('WORKSPACE', os.getcwd())
 PR_TRACKING_PATH = os.getenv('PR_TRACKING_PATH', os.path.join(WORKSPACE_DIR, 'pr_tracking.json'))
 LEARNING_DB_PATH = os.getenv('LEARNING_DB_PATH', os.path.join(WORKSPACE_DIR, 'learning_db.json'))
+# Lock file serializing load-modify-save of the two files across processes
+# (webhook server, monitor cron, add-pr, Release builds)
+LEARNING_STATE_LOCK_PATH = os.getenv('LEARNING_STATE_LOCK_PATH',
+                                     os.path.join(WORKSPACE_DIR, '.learning_state.lock'))
 
 # Learning thresholds
 SUCCESS_THRESHOLD = int(os.getenv('SUCCESS_THRESHOLD', '3'))  # Promote after 3 successes
 FAILURE_THRESHOLD = int(os.getenv('FAILURE_THRESHOLD', '2'))  # Demote after 2 failures
 CONSECUTIVE_SUCCESS_THRESHOLD = 3  # Consecutive successes needed for promotion
 
+# Webhooks deliver outcomes within seconds; only PRs still open after this long
+# are polled, as a fallback for missed deliveries
+PR_RECONCILE_AFTER_HOURS = float(os.getenv('PR_RECONCILE_AFTER_HOURS', '24'))
+
+# orjson parses large files straight from the page cache (mmap) instead of a read buffer
+MMAP_LOAD_MIN_BYTES = 1024 * 1024
+
 GITHUB_API_BASE = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}"
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Commit authors used by the auto-fix pipeline; any other last author means a human edited the PR
+AUTO_FIX_AUTHOR_RE = re.compile(r'Build Automation|GPT')
+GRAPHQL_BATCH_SIZE = 100  # PRs per GraphQL query (GitHub's node limit per connection)
+MONITOR_FETCH_WORKERS = 16  # concurrent REST status checks when GraphQL can't cover a PR
 
 # === LOGGING ===
+# The monitor loop only enqueues records; a background listener does the file and
+# console writes (same setup as pr_merge_handler)
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler('pr_outcome_monitor.log', encoding='utf-8'),
+    logging.StreamHandler()
+)
 logging.basicConfig(
     level=logging.INFO,
     format='[%(asctime)s] [%(levelname)s] [pr-monitor] %(message)s',
-    handlers=[
-        logging.FileHandler('pr_outcome_monitor.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
+def _load_json_file(path: str) -> Dict:
+    """Read and parse a JSON file (orjson when installed, mmap'd when large)."""
+    with open(path, 'rb') as f:
+        if HAS_ORJSON and os.fstat(f.fileno()).st_size >= MMAP_LOAD_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        raw = f.read()
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+
+@contextmanager
+def learning_state_lock(lock_path: str = LEARNING_STATE_LOCK_PATH):
+    """
+    Hold an exclusive inter-process lock around a load-modify-save of
+    pr_tracking.json / learning_db.json.
+    
+    The atomic save only prevents torn files. Two processes that each load, modify
+    and save would still drop each other's updates, so callers take this lock,
+    reload() from disk, apply their change and save before releasing it.
+    """
+    with open(lock_path, 'a') as lock_file:
+        if HAS_FCNTL:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if HAS_FCNTL:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _write_file_atomic(path: str, payload: bytes) -> None:
+    """
+    Write payload to path via a fsync'd temp file in the same directory and os.replace.
+    
+    A crash mid-write leaves the old file intact instead of a truncated one
+    that _load would replace with an empty database.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                    prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _dump_json_bytes(data: Dict) -> bytes:
+    """Serialize to indented JSON bytes (orjson when installed)."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
 class PRTracker:
     """Manages tracking of PRs and their outcomes."""
     
@@ -105,7 +220,15 @@ class PRTracker:
             tracking_path: Path to pr_tracking.json file
         """
         self.tracking_path = tracking_path
+        self.reload()
+    
+    def reload(self) -> None:
+        """Re-read the tracking file, picking up other processes' writes."""
         self.data = self._load()
+        # pr_number -> its entries (add_pr stores one entry per root cause)
+        self._by_number: Dict[int, List[Dict]] = {}
+        for pr in self.data["prs"]:
+            self._by_number.setdefault(pr["pr_number"], []).append(pr)
     
     def _load(self) -> Dict:
         """Load PR tracking data from disk."""
@@ -114,8 +237,7 @@ class PRTracker:
             return {"prs": [], "metadata": {"created": datetime.now().isoformat()}}
         
         try:
-            with open(self.tracking_path, 'r') as f:
-                return json.load(f)
+            return _load_json_file(self.tracking_path)
         except Exception as e:
             logger.error(f"Failed to load PR tracking data: {e}")
             return {"prs": [], "metadata": {"created": datetime.now().isoformat()}}
@@ -123,15 +245,15 @@ class PRTracker:
     def save(self) -> bool:
         """Save PR tracking data to disk."""
         try:
-            with open(self.tracking_path, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            # Serialize first, then one write to a temp file swapped in atomically
+            _write_file_atomic(self.tracking_path, _dump_json_bytes(self.data))
             return True
         except Exception as e:
             logger.error(f"Failed to save PR tracking data: {e}")
             return False
     
     def add_pr(self, pr_number: int, root_cause: str, error_message: str = None,
-               branch: str = None, base_branch: str = 'Release') -> bool:
+               branch: str = None, base_branch: str = 'Release', save: bool = True) -> bool:
         """
         Track a new PR.
         
@@ -141,6 +263,7 @@ class PRTracker:
             error_message: Original error message
             branch: PR branch name
             base_branch: Base branch PR targets
+            save: Write the tracking file to disk (False when batching several changes)
         
         Returns:
             True if added successfully
@@ -161,46 +284,67 @@ class PRTracker:
         }
         
         self.data["prs"].append(pr_entry)
-        return self.save()
+        self._by_number.setdefault(pr_number, []).append(pr_entry)
+        return self.save() if save else True
     
     def update_pr_status(self, pr_number: int, status: str, outcome: str = None,
-                        merged_at: str = None) -> bool:
+                        merged_at: str = None, save: bool = True,
+                        now_iso: Optional[str] = None) -> bool:
         """
-        Update PR status.
+        Update PR status (every entry tracked for the PR, one per root cause).
         
         Args:
             pr_number: GitHub PR number
             status: 'open', 'merged', 'closed'
             outcome: 'success' or 'failure'
             merged_at: ISO timestamp of when PR was merged
+            save: Write the tracking file to disk (False when batching several changes)
+            now_iso: Timestamp to record, shared across a batch (defaults to now)
         
         Returns:
             True if updated successfully
         """
-        for pr in self.data["prs"]:
-            if pr["pr_number"] == pr_number:
-                pr["status"] = status
-                pr["outcome"] = outcome
-                pr["outcome_checked_at"] = datetime.now().isoformat()
-                if merged_at:
-                    pr["merged_at"] = merged_at
-                
-                logger.info(f"  Updated PR #{pr_number}: {status} → {outcome}")
-                return self.save()
+        entries = self._by_number.get(pr_number)
+        if not entries:
+            logger.warning(f"  PR #{pr_number} not found in tracking data")
+            return False
+        
+        checked_at = now_iso or datetime.now().isoformat()
+        for pr in entries:
+            pr["status"] = status
+            pr["outcome"] = outcome
+            pr["outcome_checked_at"] = checked_at
+            if merged_at:
+                pr["merged_at"] = merged_at
         
-        logger.warning(f"  PR #{pr_number} not found in tracking data")
-        return False
+        logger.info(f"  Updated PR #{pr_number}: {status} → {outcome}")
+        return self.save() if save else True
     
-    def get_open_prs(self) -> List[Dict]:
-        """Get list of open PRs."""
-        return [pr for pr in self.data["prs"] if pr["status"] == "open"]
+    def get_open_prs(self, older_than: Optional[timedelta] = None) -> List[Dict]:
+        """
+        Get list of open PRs.
+        
+        Args:
+            older_than: Only return PRs created at least this long ago
+        """
+        if older_than is None:
+            return [pr for pr in self.data["prs"] if pr["status"] == "open"]
+        
+        # ISO timestamps from datetime.isoformat() sort chronologically as strings
+        cutoff = (datetime.now() - older_than).isoformat()
+        return [
+            pr for pr in self.data["prs"]
+            if pr["status"] == "open" and (pr.get("created_at") or "") <= cutoff
+        ]
+    
+    def get_pr_entries(self, pr_number: int) -> List[Dict]:
+        """Get every tracked entry (one per root cause) for a PR."""
+        return self._by_number.get(pr_number, [])
     
     def get_pr(self, pr_number: int) -> Optional[Dict]:
-        """Get PR by number."""
-        for pr in self.data["prs"]:
-            if pr["pr_number"] == pr_number:
-                return pr
-        return None
+        """Get PR by number (its first tracked entry)."""
+        entries = self._by_number.get(pr_number)
+        return entries[0] if entries else None
 
 
 class LearningDatabase:
@@ -216,42 +360,52 @@ class LearningDatabase:
         self.db_path = db_path
         self.data = self._load()
     
+    def reload(self) -> None:
+        """Re-read the database file, picking up other processes' writes."""
+        self.data = self._load()
+    
     def _load(self) -> Dict:
         """Load learning database from disk."""
         if not os.path.exists(self.db_path):
             logger.info(f"Creating new learning database: {self.db_path}")
-            return {
-                "metadata": {
-                    "version": "2.0",
-                    "created": datetime.now().isoformat(),
-                    "last_updated": datetime.now().isoformat(),
-                    "total_patterns": 0,
-                    "promoted_patterns": 0,
-                    "demoted_patterns": 0
-                },
-                "root_causes": {}
-            }
+            return self._empty_database()
         
         try:
-            with open(self.db_path, 'r') as f:
-                return json.load(f)
+            return _load_json_file(self.db_path)
         except Exception as e:
             logger.error(f"Failed to load learning database: {e}")
-            return self._load()  # Recurse to create new DB
+            return self._empty_database()
+    
+    @staticmethod
+    def _empty_database() -> Dict:
+        """Fresh database structure."""
+        now = datetime.now().isoformat()
+        return {
+            "metadata": {
+                "version": "2.0",
+                "created": now,
+                "last_updated": now,
+                "total_patterns": 0,
+                "promoted_patterns": 0,
+                "demoted_patterns": 0
+            },
+            "root_causes": {}
+        }
     
     def save(self) -> bool:
         """Save learning database to disk."""
         try:
             self.data["metadata"]["last_updated"] = datetime.now().isoformat()
-            with open(self.db_path, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            # Serialize first, then one write to a temp file swapped in atomically
+            _write_file_atomic(self.db_path, _dump_json_bytes(self.data))
             return True
         except Exception as e:
             logger.error(f"Failed to save learning database: {e}")
             return False
     
     def record_outcome(self, root_cause: str, success: bool, error_signature: str = None, 
-                      fix_summary: str = None, error_message: str = None) -> bool:
+                      fix_summary: str = None, error_message: str = None, save: bool = True,
+                      now_iso: Optional[str] = None) -> bool:
         """
         Record the outcome of a PR with enhanced metadata.
         
@@ -261,10 +415,13 @@ class LearningDatabase:
             error_signature: Normalized error signature for pattern matching
             fix_summary: Human-readable description of the fix
             error_message: Original error message
+            save: Write the database to disk (False when batching, see record_and_check_bulk)
+            now_iso: Timestamp to record, shared across a batch (defaults to now)
         
         Returns:
             True if recorded successfully
         """
+        now_iso = now_iso or datetime.now().isoformat()
         logger.info(f"Recording outcome for {root_cause}: {'SUCCESS' if success else 'FAILURE'}")
         
         if root_cause not in self.data["root_causes"]:
@@ -276,7 +433,7 @@ class LearningDatabase:
                 "consecutive_failures": 0,
                 "total_attempts": 0,
                 "promoted_at": None,
-                "last_update": datetime.now().isoformat(),
+                "last_update": now_iso,
                 "error_signature": error_signature or "",
                 "fix_type": self._infer_fix_type(root_cause),
                 "times_seen": 0,
@@ -287,7 +444,7 @@ class LearningDatabase:
         pattern = self.data["root_causes"][root_cause]
         pattern["total_attempts"] += 1
         pattern["times_seen"] = pattern.get("times_seen", 0) + 1
-        pattern["last_update"] = datetime.now().isoformat()
+        pattern["last_update"] = now_iso
         
         # Update enhanced fields if provided
         if error_signature and not pattern.get("error_signature"):
@@ -314,7 +471,43 @@ class LearningDatabase:
             logger.info(f"  {root_cause}: {pattern['failure_count']} failures, "
                        f"{pattern['consecutive_failures']} consecutive")
         
-        return self.save()
+        return self.save() if save else True
+    
+    def record_and_check_bulk(self, outcomes: List[Tuple[str, bool]],
+                              now_iso: Optional[str] = None) -> Tuple[List[str], List[str]]:
+        """
+        Record outcomes, apply the promotions/demotions they trigger, and write to disk once.
+        
+        Args:
+            outcomes: (root_cause, success) pairs, applied in order
+            now_iso: Timestamp to record, shared across the batch (defaults to now)
+        
+        Returns:
+            Tuple of (promoted, demoted) root causes whose confidence actually changed
+        """
+        now_iso = now_iso or datetime.now().isoformat()
+        for root_cause, success in outcomes:
+            self.record_outcome(root_cause, success, save=False, now_iso=now_iso)
+        
+        promoted, demoted = [], []
+        for root_cause in dict.fromkeys(root_cause for root_cause, _ in outcomes):
+            pattern = self.data["root_causes"][root_cause]
+            
+            should_promote, reason = self.check_promotion(root_cause)
+            if should_promote and pattern["confidence"] != "high":
+                logger.info(f"  ✅ Promotion criteria met: {reason}")
+                self.promote_pattern(root_cause, save=False, now_iso=now_iso)
+                promoted.append(root_cause)
+                continue
+            
+            should_demote, reason = self.check_demotion(root_cause)
+            if should_demote:
+                logger.warning(f"  ⚠️ Demotion criteria met: {reason}")
+                self.demote_pattern(root_cause, save=False)
+                demoted.append(root_cause)
+        
+        self.save()
+        return promoted, demoted
     
     def _infer_fix_type(self, root_cause: str) -> str:
         """Infer fix type from root cause category."""
@@ -394,12 +587,15 @@ class LearningDatabase:
         
         return False, None
     
-    def promote_pattern(self, root_cause: str) -> bool:
+    def promote_pattern(self, root_cause: str, save: bool = True,
+                        now_iso: Optional[str] = None) -> bool:
         """
         Promote a pattern to HIGH confidence.
         
         Args:
             root_cause: Root cause classification
+            save: Write the database to disk (False when batching, see record_and_check_bulk)
+            now_iso: Timestamp to record, shared across a batch (defaults to now)
         
         Returns:
             True if promoted successfully
@@ -415,10 +611,10 @@ class LearningDatabase:
         
         logger.info(f"  🚀 PROMOTING {root_cause} to HIGH confidence!")
         pattern["confidence"] = "high"
-        pattern["promoted_at"] = datetime.now().isoformat()
+        pattern["promoted_at"] = now_iso or datetime.now().isoformat()
         self.data["metadata"]["promoted_patterns"] += 1
         
-        return self.save()
+        return self.save() if save else True
     
     def check_demotion(self, root_cause: str) -> Tuple[bool, Optional[str]]:
         """
@@ -449,12 +645,13 @@ class LearningDatabase:
         
         return False, None
     
-    def demote_pattern(self, root_cause: str) -> bool:
+    def demote_pattern(self, root_cause: str, save: bool = True) -> bool:
         """
         Demote a pattern from HIGH back to LOW confidence.
         
         Args:
             root_cause: Root cause classification
+            save: Write the database to disk (False when batching, see record_and_check_bulk)
         
         Returns:
             True if demoted successfully
@@ -473,7 +670,7 @@ class LearningDatabase:
         pattern["consecutive_successes"] = 0
         self.data["metadata"]["demoted_patterns"] += 1
         
-        return self.save()
+        return self.save() if save else True
 
 
 class PROutcomeMonitor:
@@ -484,6 +681,16 @@ class PROutcomeMonitor:
         self.tracker = PRTracker()
         self.learning_db = LearningDatabase()
         self.github_headers = self._get_github_headers()
+        # One keep-alive connection to api.github.com for the whole reconciliation
+        # run instead of a new TCP+TLS handshake per request
+        self.session = requests.Session()
+        self.session.headers.update(self.github_headers)
+        # Pool sized for MONITOR_FETCH_WORKERS; Retry only repeats idempotent GETs
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=MONITOR_FETCH_WORKERS,
+            pool_maxsize=MONITOR_FETCH_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+        ))
         logger.info("PR Outcome Monitor initialized")
     
     def _get_github_headers(self) -> Dict:
@@ -507,7 +714,7 @@ class PROutcomeMonitor:
         """
         try:
             url = f"{GITHUB_API_BASE}/pulls/{pr_number}"
-            response = requests.get(url, headers=self.github_headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
                 return response.json()
@@ -519,25 +726,101 @@ class PROutcomeMonitor:
             logger.error(f"Error fetching PR from GitHub: {e}")
             return None
     
-    def check_pr_commits(self, pr_number: int, branch: str) -> Tuple[bool, int]:
+    def fetch_prs_from_github_bulk(self, pr_numbers: List[int]) -> Dict[int, Dict]:
+        """
+        Fetch status for many PRs with GitHub GraphQL, up to 100 PRs per request.
+        
+        Args:
+            pr_numbers: GitHub PR numbers
+        
+        Returns:
+            Dictionary of PR number -> PR data shaped like the REST fields used by
+            check_pr_status, plus last_commit_author. PRs not fetched are omitted.
+        """
+        results = {}
+        
+        for i in range(0, len(pr_numbers), GRAPHQL_BATCH_SIZE):
+            batch = pr_numbers[i:i + GRAPHQL_BATCH_SIZE]
+            aliases = ' '.join(
+                f'pr{n}: pullRequest(number: {int(n)}) {{ number state mergedAt '
+                f'commits(last: 1) {{ totalCount nodes {{ commit {{ author {{ name }} }} }} }} }}'
+                for n in batch
+            )
+            query = f'query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {aliases} }} }}'
+            
+            try:
+                response = self.session.post(
+                    GITHUB_GRAPHQL_URL,
+                    json={'query': query, 'variables': {'owner': REPO_OWNER, 'name': REPO_NAME}},
+                    timeout=30
+                )
+                if response.status_code != 200:
+                    logger.warning(f"  GitHub GraphQL returned {response.status_code}")
+                    continue
+                
+                # Missing PRs come back as null nodes alongside an "errors" list
+                repository = (response.json().get('data') or {}).get('repository') or {}
+                for node in repository.values():
+                    if node:
+                        commits = node['commits']
+                        last_commit = commits['nodes'][-1]['commit'] if commits['nodes'] else {}
+                        results[node['number']] = {
+                            'number': node['number'],
+                            'state': node['state'].lower(),
+                            'merged_at': node['mergedAt'],
+                            'commits': commits['totalCount'],
+                            'last_commit_author': (last_commit.get('author') or {}).get('name') or '',
+                        }
+            except Exception as e:
+                logger.error(f"Error fetching PRs via GraphQL: {e}")
+        
+        return results
+    
+    def check_pr_commits(self, pr_number: int, branch: str,
+                         commit_count: Optional[int] = None,
+                         last_author: Optional[str] = None) -> Tuple[bool, int]:
         """
         Check if PR has commits beyond what the LLM auto-fix created.
         
         Args:
             pr_number: GitHub PR number
             branch: PR branch name
+            commit_count: Commit count already known from the PR details, if any
+            last_author: Last commit author already known (GraphQL batch), if any
         
         Returns:
             Tuple of (modified_by_humans, commit_count)
         """
+        # The PR details already carry the commit count - more than one commit
+        # settles it without a second round trip for the commit list
+        if commit_count is not None and commit_count > 1:
+            logger.info(f"  PR has {commit_count} commits (more than 1)")
+            return True, commit_count
+        
+        # A GraphQL batch also carries the last author, so nothing left to fetch
+        if commit_count is not None and last_author is not None:
+            is_modified = not AUTO_FIX_AUTHOR_RE.search(last_author)
+            if is_modified:
+                logger.info(f"  Last commit author: {last_author}")
+            return is_modified, commit_count
+        
         try:
+            # Only one commit is ever inspected: ask for one per page. A rel="last"
+            # link means more pages, i.e. more than one commit, and its page number
+            # is the commit count - no need to download the whole list
             url = f"{GITHUB_API_BASE}/pulls/{pr_number}/commits"
-            response = requests.get(url, headers=self.github_headers, timeout=10)
+            response = self.session.get(url, params={'per_page': 1}, timeout=10)
             
             if response.status_code != 200:
                 logger.warning(f"  Could not fetch PR commits: {response.status_code}")
                 return False, 0
             
+            last_page = response.links.get('last')
+            if last_page:
+                commit_count = int(parse_qs(urlparse(last_page['url']).query)['page'][0])
+                logger.info(f"  PR has {commit_count} commits (more than 1)")
+                return True, commit_count
+            
             commits = response.json()
             
             # Heuristic: If more than 1 commit or last commit author is not "Build Automation"
@@ -550,7 +833,7 @@ class PROutcomeMonitor:
             
             if commits:
                 last_author = commits[-1].get('commit', {}).get('author', {}).get('name', '')
-                if 'Build Automation' not in last_author and 'GPT' not in last_author:
+                if not AUTO_FIX_AUTHOR_RE.search(last_author):
                     logger.info(f"  Last commit author: {last_author}")
                     is_modified = True
             
@@ -560,12 +843,13 @@ class PROutcomeMonitor:
             logger.error(f"Error checking PR commits: {e}")
             return False, 0
     
-    def check_pr_status(self, pr_number: int) -> Optional[Tuple[str, bool]]:
+    def check_pr_status(self, pr_number: int, gh_pr: Optional[Dict] = None) -> Optional[Tuple[str, bool]]:
         """
         Check the status of a PR and determine if it was a success or failure.
         
         Args:
             pr_number: GitHub PR number
+            gh_pr: PR data already fetched (see fetch_prs_from_github_bulk), if any
         
         Returns:
             Tuple of (status, success) or None if failed to fetch
@@ -580,8 +864,8 @@ class PROutcomeMonitor:
             logger.warning(f"  PR #{pr_number} not in tracking database")
             return None
         
-        # Fetch from GitHub
-        gh_pr = self.fetch_pr_from_github(pr_number)
+        # Fetch from GitHub unless the batch already did
+        gh_pr = gh_pr or self.fetch_pr_from_github(pr_number)
         if not gh_pr:
             logger.warning(f"  Could not fetch PR #{pr_number} from GitHub")
             return None
@@ -591,7 +875,9 @@ class PROutcomeMonitor:
         
         if status == 'merged' or gh_pr.get('merged_at'):
             # Merged - check if modified by humans
-            is_modified, commit_count = self.check_pr_commits(pr_number, tracked_pr['branch'])
+            is_modified, commit_count = self.check_pr_commits(
+                pr_number, tracked_pr['branch'], gh_pr.get('commits'), gh_pr.get('last_commit_author')
+            )
             
             if is_modified:
                 logger.info(f"  ✓ MERGED (with human modifications) → Likely SUCCESS")
@@ -610,51 +896,76 @@ class PROutcomeMonitor:
             logger.info(f"  ℹ️ Still OPEN → no outcome yet")
             return ('open', None)
     
-    def monitor_open_prs(self) -> None:
+    def monitor_open_prs(self, reconcile_after_hours: float = PR_RECONCILE_AFTER_HOURS) -> None:
         """
-        Check status of all open PRs and update outcomes in learning database.
+        Check status of open PRs and update outcomes in learning database.
+        
+        Recent PRs are left to the webhook path (pr_merge_handler); only PRs still
+        open after reconcile_after_hours are polled. Pass 0 to check every open PR.
         """
         logger.info("=" * 60)
         logger.info("PR OUTCOME MONITORING STARTED")
         logger.info("=" * 60)
         
-        open_prs = self.tracker.get_open_prs()
-        logger.info(f"Monitoring {len(open_prs)} open PRs...")
+        open_prs = self.tracker.get_open_prs(older_than=timedelta(hours=reconcile_after_hours))
+        logger.info(f"Monitoring {len(open_prs)} open PRs older than {reconcile_after_hours:g}h...")
         
-        for pr in open_prs:
-            pr_number = pr["pr_number"]
-            root_cause = pr["root_cause"]
-            
+        # One GraphQL request per 100 PRs instead of 1-2 REST calls each. GraphQL
+        # needs a token; PRs missing from the batch fall back to REST one by one
+        pr_numbers = list(dict.fromkeys(pr["pr_number"] for pr in open_prs))
+        prefetched = {}
+        if GITHUB_PAT and pr_numbers:
+            prefetched = self.fetch_prs_from_github_bulk(pr_numbers)
+        
+        def check(pr_number: int) -> Optional[Tuple[str, bool]]:
             try:
-                # Check PR status
-                result = self.check_pr_status(pr_number)
-                
-                if result is None:
-                    continue
-                
-                status, success = result
-                
-                if success is not None:  # Has a definitive outcome
-                    # Update PR tracking
-                    outcome = 'success' if success else 'failure'
-                    self.tracker.update_pr_status(pr_number, status, outcome)
-                    
-                    # Record in learning database
-                    self.learning_db.record_outcome(root_cause, success)
+                return self.check_pr_status(pr_number, prefetched.get(pr_number))
+            except Exception as e:
+                logger.error(f"Error checking PR #{pr_number}: {e}")
+                return None
+        
+        # Status checks are network-bound and read-only: run them concurrently,
+        # once per PR, then apply the outcomes to the tracker and DB serially below
+        with ThreadPoolExecutor(max_workers=MONITOR_FETCH_WORKERS) as executor:
+            statuses = dict(zip(pr_numbers, executor.map(check, pr_numbers)))
+        
+        now_iso = datetime.now().isoformat()
+        
+        # Apply under the lock to freshly reloaded files: the webhook server (or another
+        # run) may have written them while the checks ran, and may already have recorded
+        # some of these PRs - those must be neither overwritten nor counted twice
+        with learning_state_lock():
+            self.tracker.reload()
+            self.learning_db.reload()
+            
+            # Outcomes are applied in memory; each file is written once after the loop
+            outcomes = []
+            for pr_number, result in statuses.items():
+                try:
+                    if result is None:
+                        continue
                     
-                    # Check for promotion/demotion
-                    should_promote, reason = self.learning_db.check_promotion(root_cause)
-                    if should_promote:
-                        logger.info(f"  ✅ Promotion criteria met: {reason}")
-                        self.learning_db.promote_pattern(root_cause)
+                    status, success = result
                     
-                    should_demote, reason = self.learning_db.check_demotion(root_cause)
-                    if should_demote:
-                        logger.warning(f"  ⚠️ Demotion criteria met: {reason}")
-                        self.learning_db.demote_pattern(root_cause)
+                    if success is not None:  # Has a definitive outcome
+                        still_open = [pr for pr in self.tracker.get_pr_entries(pr_number)
+                                      if pr["status"] == "open"]
+                        if not still_open:
+                            logger.info(f"  PR #{pr_number} already recorded - skipping")
+                            continue
+                        
+                        # Update PR tracking
+                        outcome = 'success' if success else 'failure'
+                        self.tracker.update_pr_status(pr_number, status, outcome, save=False, now_iso=now_iso)
+                        outcomes.extend((pr["root_cause"], success) for pr in still_open)
+                
+                except Exception as e:
+                    logger.error(f"Error processing PR #{pr_number}: {e}")
             
-            except Exception as e:
-                logger.error(f"Error processing PR #{pr_number}: {e}")
+            if outcomes:
+                self.tracker.save()
+                # Record in learning database, then promote/demote, in one write
+                self.learning_db.record_and_check_bulk(outcomes, now_iso=now_iso)
         
         logger.info("=" * 60)
         logger.info("PR OUTCOME MONITORING COMPLETED")
@@ -681,11 +992,13 @@ def main():
             root_cause = sys.argv[3]
             error_message = sys.argv[4] if len(sys.argv) > 4 else None
             
-            monitor.tracker.add_pr(pr_number, root_cause, error_message)
+            with learning_state_lock():
+                monitor.tracker.reload()
+                monitor.tracker.add_pr(pr_number, root_cause, error_message)
             print(f"Added PR #{pr_number} with root cause: {root_cause}")
         
         elif command == 'status':
-            print(json.dumps(monitor.learning_db.data, indent=2))
+            print(_dump_json_bytes(monitor.learning_db.data).decode('utf-8'))
         
         else:
             print(f"Unknown command: {command}")
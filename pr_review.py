@@ -4,6 +4,8 @@ import json
 import re
 import subprocess
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from openai import AzureOpenAI
 
@@ -18,18 +20,53 @@ REPO_OWNER = os.getenv("REPO_OWNER", "vaibhavsaxena619")
 REPO_NAME = os.getenv("REPO_NAME", "poc-auto-pr-fix")
 GITHUB_API_BASE = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}"
 
+# Shared keep-alive session: the PR info fetches and the review comment post
+# reuse pooled connections to api.github.com instead of a new TLS handshake each
+GITHUB_SESSION = requests.Session()
+
+# Deprecated java.util.Date accessors, matched in one pass per diff line
+DEPRECATED_METHODS = ['getDate', 'getMonth', 'getYear', 'setDate', 'setMonth', 'setYear']
+DEPRECATED_METHOD_RE = re.compile('|'.join(map(re.escape, DEPRECATED_METHODS)))
+
+# Common typos in comments -> correction, matched case-insensitively in one pass
+COMMON_TYPOS = {
+    'recieve': 'receive',
+    'occured': 'occurred',
+    'seperator': 'separator',
+    'succesfully': 'successfully',
+    'coordiante': 'coordinate',
+    'adress': 'address',
+    'sturcture': 'structure',
+    'lenght': 'length'
+}
+TYPO_RE = re.compile('|'.join(map(re.escape, COMMON_TYPOS)), re.IGNORECASE)
+
+# New-file start line of a diff hunk header: @@ -a,b +c,d @@
+HUNK_NEW_START_RE = re.compile(r'\+(\d+)')
+
 def fail(msg: str):
     print(f"[pr-review] ERROR: {msg}")
     sys.exit(1)
 
+@lru_cache(maxsize=1)
+def get_azure_client() -> AzureOpenAI:
+    """Return a shared Azure OpenAI client (keeps its HTTP connection pool warm)."""
+    return AzureOpenAI(
+        api_key=AZURE_OPENAI_API_KEY,
+        api_version=AZURE_OPENAI_API_VERSION,
+        azure_endpoint=AZURE_OPENAI_ENDPOINT
+    )
+
 def run_git_command(cmd: list) -> str:
     """Run a git command and return the output"""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return result.stdout.strip()
+        # Capture bytes and decode once as UTF-8 (git's encoding) rather than
+        # through a locale-dependent TextIOWrapper
+        result = subprocess.run(cmd, capture_output=True, check=True)
+        return result.stdout.decode('utf-8', 'replace').strip()
     except subprocess.CalledProcessError as e:
         print(f"[pr-review] Git command failed: {' '.join(cmd)}")
-        print(f"[pr-review] Error: {e.stderr}")
+        print(f"[pr-review] Error: {e.stderr.decode('utf-8', 'replace')}")
         return ""
 
 def get_pr_diff(base_branch: str, head_branch: str) -> str:
@@ -78,7 +115,7 @@ def check_code_quality(diff_content: str) -> dict:
     for line_idx, line in enumerate(lines):
         # Track line numbers from @@ markers
         if line.startswith('@@'):
-            match = re.search(r'\+(\d+)', line)
+            match = HUNK_NEW_START_RE.search(line)
             if match:
                 actual_line_num = int(match.group(1))
             continue
@@ -133,9 +170,9 @@ def check_code_quality(diff_content: str) -> dict:
             })
         
         # Deprecated method usage
-        deprecated_methods = ['getDate', 'getMonth', 'getYear', 'setDate', 'setMonth', 'setYear']
-        for method in deprecated_methods:
-            if method in content:
+        found_methods = {m.group() for m in DEPRECATED_METHOD_RE.finditer(content)}
+        for method in DEPRECATED_METHODS:
+            if method in found_methods:
                 issues['bad_practices'].append({
                     'type': 'deprecated_method',
                     'method': method,
@@ -157,17 +194,16 @@ def check_code_quality(diff_content: str) -> dict:
                 'severity': 'major'
             })
         
-        # Missing null checks
+        # Missing null checks (a '.get(' call with no null/Optional handling on the line)
         if '.get(' in content and 'null' not in content and 'Optional' not in content:
-            if any(word in content for word in ['HashMap', '.get(', '.getOrDefault', '.getValue']):
-                issues['bad_practices'].append({
-                    'type': 'potential_null_pointer',
-                    'file': current_file,
-                    'line_num': actual_line_num,
-                    'line': content.strip()[:80],
-                    'suggestion': 'Consider null-checking or using Optional',
-                    'severity': 'major'
-                })
+            issues['bad_practices'].append({
+                'type': 'potential_null_pointer',
+                'file': current_file,
+                'line_num': actual_line_num,
+                'line': content.strip()[:80],
+                'suggestion': 'Consider null-checking or using Optional',
+                'severity': 'major'
+            })
         
         # Empty catch blocks
         if 'catch' in content and 'catch(Exception e)' in content:
@@ -185,19 +221,9 @@ def check_code_quality(diff_content: str) -> dict:
             comment_part = content.split('//')[1] if '//' in content else content
             
             # Common typos
-            typos = {
-                'recieve': 'receive',
-                'occured': 'occurred',
-                'seperator': 'separator',
-                'succesfully': 'successfully',
-                'coordiante': 'coordinate',
-                'adress': 'address',
-                'sturcture': 'structure',
-                'lenght': 'length'
-            }
-            
-            for typo, correct in typos.items():
-                if typo in comment_part.lower():
+            found_typos = {m.group().lower() for m in TYPO_RE.finditer(comment_part)}
+            for typo, correct in COMMON_TYPOS.items():
+                if typo in found_typos:
                     issues['spelling'].append({
                         'type': 'spelling_error',
                         'word': typo,
@@ -384,11 +410,7 @@ The automated code review system experienced technical difficulties while analyz
 *🤖 Automated message from Jenkins CI/CD Pipeline*"""
     
     try:
-        client = AzureOpenAI(
-            api_key=AZURE_OPENAI_API_KEY,
-            api_version=AZURE_OPENAI_API_VERSION,
-            azure_endpoint=AZURE_OPENAI_ENDPOINT
-        )
+        client = get_azure_client()
         response = client.chat.completions.create(
             model=AZURE_OPENAI_DEPLOYMENT_NAME,
             messages=[
@@ -457,7 +479,7 @@ def post_github_comment(pr_number: int, comment: str, pr_info: dict = None):
     data = {"body": enhanced_comment}
     
     try:
-        response = requests.post(url, headers=headers, json=data)
+        response = GITHUB_SESSION.post(url, headers=headers, json=data)
         if response.status_code == 201:
             print(f"[pr-review] ✅ Successfully posted review comment on PR #{pr_number}")
             comment_url = response.json().get("html_url", "")
@@ -481,16 +503,20 @@ def get_pr_info(pr_number: int) -> dict:
         "Accept": "application/vnd.github.v3+json"
     }
     
-    # Get PR details
+    # PR details and changed files are independent - fetch them concurrently
     url = f"{GITHUB_API_BASE}/pulls/{pr_number}"
+    files_url = f"{GITHUB_API_BASE}/pulls/{pr_number}/files"
     try:
-        response = requests.get(url, headers=headers)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            pr_future = pool.submit(GITHUB_SESSION.get, url, headers=headers)
+            files_future = pool.submit(GITHUB_SESSION.get, files_url, headers=headers)
+            response = pr_future.result()
+            files_response = files_future.result()
+        
         if response.status_code == 200:
             pr_data = response.json()
             
             # Get files changed
-            files_url = f"{GITHUB_API_BASE}/pulls/{pr_number}/files"
-            files_response = requests.get(files_url, headers=headers)
             files_changed = []
             if files_response.status_code == 200:
                 files_data = files_response.json()
@@ -520,9 +546,14 @@ def main():
     print(f"[pr-review] Starting {review_type} for PR #{pr_number}")
     print(f"[pr-review] Branches: {head_branch} -> {base_branch}")
     
-    # Get detailed PR information
+    # PR metadata (GitHub API) and the diff (local git) are independent - overlap them
     print("[pr-review] Fetching PR information from GitHub...")
-    pr_info = get_pr_info(pr_number)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pr_info_future = pool.submit(get_pr_info, pr_number)
+        
+        print("[pr-review] Analyzing code changes...")
+        diff_content = get_pr_diff(base_branch, head_branch)
+        pr_info = pr_info_future.result()
     
     if pr_info:
         print(f"[pr-review] PR Title: {pr_info.get('title', 'N/A')}")
@@ -530,10 +561,6 @@ def main():
         print(f"[pr-review] Files Changed: {pr_info.get('changed_files', 'N/A')}")
         print(f"[pr-review] Changes: +{pr_info.get('additions', 0)}/-{pr_info.get('deletions', 0)}")
     
-    # Get diff content
-    print("[pr-review] Analyzing code changes...")
-    diff_content = get_pr_diff(base_branch, head_branch)
-    
     if not diff_content.strip():
         comment = f"""## 📋 No Code Changes Detected
 
@@ -558,14 +585,17 @@ No code changes found between `{base_branch}` and `{head_branch}` branches.
     
     print(f"[pr-review] Found {len(diff_content.splitlines())} lines of changes")
     
-    # ===== NEW: Code Quality Analysis =====
-    print("[pr-review] Running code quality checks (spelling, formatting, bad practices)...")
-    quality_issues = check_code_quality(diff_content)
-    quality_report = format_quality_report(quality_issues)
-    
-    # Generate review with PR context
+    # Generate review with PR context; the local quality checks run while the LLM call is in flight
     print(f"[pr-review] Generating {review_type} analysis with Azure OpenAI...")
-    review_content = call_azure_openai_for_review(diff_content, review_type, pr_info)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        review_future = pool.submit(call_azure_openai_for_review, diff_content, review_type, pr_info)
+        
+        # ===== NEW: Code Quality Analysis =====
+        print("[pr-review] Running code quality checks (spelling, formatting, bad practices)...")
+        quality_issues = check_code_quality(diff_content)
+        quality_report = format_quality_report(quality_issues)
+        
+        review_content = review_future.result()
     
     # ===== COMBINE: Append quality report to review =====
     review_content += quality_report
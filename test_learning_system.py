@@ -85,6 +85,44 @@ def test_learning_database():
         return False
 
 
+def test_outcome_bulk_promotion():
+    """Test 1b: PR outcome DB promotes/demotes in one batched write."""
+    print("\n" + "="*70)
+    print("TEST 1b: Bulk Outcome Promotion")
+    print("="*70)
+    
+    try:
+        import tempfile
+        from pr_outcome_monitor import LearningDatabase as OutcomeDatabase
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db = OutcomeDatabase(os.path.join(tmp, "learning_db.json"))
+            
+            promoted, demoted = db.record_and_check_bulk([("missing_import", True)] * 2)
+            assert promoted == [] and demoted == [], "Promoted before threshold"
+            print("✅ No promotion below threshold")
+            
+            promoted, _ = db.record_and_check_bulk([("missing_import", True)])
+            assert promoted == ["missing_import"], f"Expected promotion, got {promoted}"
+            assert OutcomeDatabase(db.db_path).data["root_causes"]["missing_import"]["confidence"] == "high"
+            print("✅ Promoted and saved after 3 consecutive successes")
+            
+            promoted, _ = db.record_and_check_bulk([("missing_import", True)])
+            assert promoted == [], "Already-HIGH pattern reported as promoted again"
+            
+            _, demoted = db.record_and_check_bulk([("missing_import", False)] * 2)
+            assert demoted == ["missing_import"], f"Expected demotion, got {demoted}"
+            print("✅ Demoted after consecutive failures")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_adaptive_classifier():
     """Test 2: Adaptive classification with learning boost."""
     print("\n" + "="*70)
@@ -132,6 +170,51 @@ def test_adaptive_classifier():
         return False
 
 
+def test_error_examples_bounded():
+    """Test 2b: Error examples keep only the most recent entries."""
+    print("\n" + "="*70)
+    print("TEST 2b: Bounded Error Examples")
+    print("="*70)
+    
+    try:
+        from learning_classifier import LearningDatabase, MAX_ERROR_EXAMPLES
+        
+        db_path = "test_learning_examples.json"
+        db = LearningDatabase(db_path)
+        
+        for i in range(MAX_ERROR_EXAMPLES + 3):
+            db.record_fix_attempt(
+                error_pattern="cannot find symbol",
+                category="missing_import",
+                success=True,
+                error_message=f"cannot find symbol at line {i}"
+            )
+        
+        examples = db.get_pattern_stats("cannot find symbol", "missing_import")["error_examples"]
+        assert len(examples) == MAX_ERROR_EXAMPLES, f"Expected {MAX_ERROR_EXAMPLES} examples, got {len(examples)}"
+        assert examples[-1]["error"].endswith(f"line {MAX_ERROR_EXAMPLES + 2}"), "Newest example not kept"
+        print(f"✅ Kept the {MAX_ERROR_EXAMPLES} most recent examples")
+        
+        # Oversized lists from older DB files are trimmed on load
+        db.data["patterns"]["missing_import:cannot find symbol"]["error_examples"] *= 3
+        db.save()
+        db2 = LearningDatabase(db_path)
+        examples = db2.get_pattern_stats("cannot find symbol", "missing_import")["error_examples"]
+        assert len(examples) == MAX_ERROR_EXAMPLES, "Examples not trimmed on load"
+        print("✅ Oversized example lists trimmed on load")
+        
+        os.remove(db_path)
+        print("✅ Test file cleaned up")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_webhook_handler():
     """Test 3: GitHub webhook payload processing."""
     print("\n" + "="*70)
@@ -241,6 +324,61 @@ def test_build_fix_integration():
         return False
 
 
+def test_extract_fixed_code():
+    """Test 4b: Code extraction from structured LLM responses."""
+    print("\n" + "="*70)
+    print("TEST 4b: Fixed Code Extraction")
+    print("="*70)
+    
+    try:
+        sys.path.insert(0, '.')
+        import build_fix_v2 as bf
+        
+        response = "✅ FIXED FILE\n```java\nclass App {}\n```\n\n🛠 CHANGES MADE\n- Line 1: fixed"
+        code = bf.extract_fixed_code(response)
+        assert code == "class App {}", f"Unexpected code: {code!r}"
+        print("✅ Code fences and CHANGES MADE section stripped")
+        
+        code = bf.extract_fixed_code("```java\nclass App {}\n```")
+        assert code == "class App {}", f"Unexpected fallback code: {code!r}"
+        print("✅ Unstructured fenced response handled")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_join_errors_for_prompt():
+    """Test 4c: Repeated javac errors collapsed before prompting."""
+    print("\n" + "="*70)
+    print("TEST 4c: Prompt Error Dedup")
+    print("="*70)
+    
+    try:
+        sys.path.insert(0, '.')
+        import build_fix_v2 as bf
+        
+        block = "src/App.java:{}: error: cannot find symbol\n        foo();\n        ^\n  symbol:   method foo()"
+        errors = [block.format(5), block.format(9), block.format(9), "src/App.java:12: error: ';' expected"]
+        joined = bf.join_errors_for_prompt(errors)
+        assert joined.count("cannot find symbol") == 1, f"Duplicate not collapsed:\n{joined}"
+        assert "also at line(s) 9)" in joined, f"Other call site lost:\n{joined}"
+        assert "';' expected" in joined, f"Distinct error dropped:\n{joined}"
+        print("✅ Repeated error sent once with its other line numbers")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_manage_learning_cli():
     """Test 5: manage_learning.py CLI commands."""
     print("\n" + "="*70)
@@ -292,6 +430,38 @@ def test_manage_learning_cli():
         return True  # Don't fail on CLI tests
 
 
+def test_format_grid():
+    """Test 5b: Table rendering for the management CLI."""
+    print("\n" + "="*70)
+    print("TEST 5b: Grid Formatter")
+    print("="*70)
+    
+    try:
+        sys.path.insert(0, '.')
+        from manage_learning import format_grid
+        
+        table = format_grid([["a", 1], ["bbb", 22]], ["Name", "N"])
+        expected = "\n".join([
+            "+------+----+",
+            "| Name | N  |",
+            "+======+====+",
+            "| a    |  1 |",
+            "+------+----+",
+            "| bbb  | 22 |",
+            "+------+----+",
+        ])
+        assert table == expected, f"Unexpected table:\n{table}"
+        print("✅ Columns padded, numbers right-aligned")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_confidence_calculations():
     """Test 6: Confidence score calculations."""
     print("\n" + "="*70)
@@ -333,10 +503,15 @@ def main():
     
     tests = [
         ("Learning Database", test_learning_database),
+        ("Bulk Outcome Promotion", test_outcome_bulk_promotion),
         ("Adaptive Classifier", test_adaptive_classifier),
+        ("Bounded Error Examples", test_error_examples_bounded),
         ("Webhook Handler", test_webhook_handler),
         ("build_fix Integration", test_build_fix_integration),
+        ("Fixed Code Extraction", test_extract_fixed_code),
+        ("Prompt Error Dedup", test_join_errors_for_prompt),
         ("Management CLI", test_manage_learning_cli),
+        ("Grid Formatter", test_format_grid),
         ("Confidence Calculations", test_confidence_calculations)
     ]
     